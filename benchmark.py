@@ -0,0 +1,201 @@
+"""Measure API throughput as the number of uvicorn workers grows.
+
+Start the shared services first (see Readme), set CHROMA_HOST and
+EMBEDDING_SERVICE_URL (shell or .env), then run:
+
+    python benchmark.py --mode shared --workers 1 2 4 --requests 200 --concurrency 16
+    python benchmark.py --mode local --workers 1 2 4 --requests 200 --concurrency 16
+
+--mode local blanks those variables for the API under test, which overrides
+.env, so every worker opens its own on-disk Chroma and loads its own model.
+That is the baseline the shared mode is compared against. Without --mode the
+API uses whatever the environment and .env configure.
+
+The API under test runs from a temporary directory with its own UPLOAD_DIR,
+so uploads and any on-disk Chroma are discarded afterwards. When CHROMA_HOST
+is set the benchmark user's documents are deleted from the server.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from dotenv import load_dotenv
+
+HOST = "127.0.0.1"
+REPO_DIR = Path(__file__).resolve().parent
+
+
+def healthPid(baseUrl: str, index: int):
+    try:
+        response = requests.get(f"{baseUrl}/health", timeout=2)
+        if response.status_code == 200:
+            return response.json()["pid"]
+    except requests.RequestException:
+        pass
+    return None
+
+
+def waitForServer(server: subprocess.Popen, baseUrl: str, workers: int, timeout: float = 300.0):
+    # A single 200 only proves one worker is up; the others may still be
+    # importing graph.py and loading the model. Wait until every worker has
+    # answered so the timed load runs on the full worker count.
+    seenPids = set()
+    deadline = time.time() + timeout
+    with ThreadPoolExecutor(max_workers=workers * 4) as pool:
+        while time.time() < deadline:
+            exitCode = server.poll()
+            if exitCode is not None:
+                raise RuntimeError(f"API process exited with code {exitCode} before it was ready")
+            pids = pool.map(lambda i: healthPid(baseUrl, i), range(workers * 4))
+            seenPids.update(pid for pid in pids if pid is not None)
+            if len(seenPids) >= workers:
+                return
+            time.sleep(1)
+    raise RuntimeError(
+        f"Only {len(seenPids)} of {workers} API workers at {baseUrl} answered within {timeout}s"
+    )
+
+
+def uploadRequest(baseUrl: str, userId: str, index: int) -> bool:
+    content = f"Benchmark document {index}: store {index % 7} sold {index * 3} units.".encode()
+    try:
+        response = requests.post(
+            f"{baseUrl}/upload",
+            files={"file": (f"bench-{index}.txt", content, "text/plain")},
+            data={"userId": userId},
+            timeout=60,
+        )
+    except requests.RequestException:
+        return False
+    return response.status_code == 200
+
+
+def filesRequest(baseUrl: str, userId: str, index: int) -> bool:
+    try:
+        response = requests.get(f"{baseUrl}/files", params={"userId": userId}, timeout=60)
+    except requests.RequestException:
+        return False
+    return response.status_code == 200
+
+
+def runLoad(server: subprocess.Popen, baseUrl: str, userId: str, requestFn, totalRequests: int, concurrency: int):
+    startTime = time.time()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(
+            pool.map(lambda i: requestFn(baseUrl, userId, i), range(totalRequests))
+        )
+    elapsed = time.time() - startTime
+    # Dropped requests count as failures, but a dead API would only produce
+    # a row of connection errors, so stop the sweep instead.
+    exitCode = server.poll()
+    if exitCode is not None:
+        raise RuntimeError(f"API process exited with code {exitCode} during the benchmark")
+    failures = outcomes.count(False)
+    return round(totalRequests / elapsed, 2), failures
+
+
+def stopServer(server: subprocess.Popen, timeout: float = 30.0):
+    # Raising here would hide the error that ended the run and leave the
+    # workers holding --port for the next worker count.
+    server.terminate()
+    try:
+        server.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        # Killing only the uvicorn supervisor would orphan its workers, so
+        # kill the whole process group it was started in.
+        if hasattr(os, "killpg"):
+            os.killpg(server.pid, signal.SIGKILL)
+        else:
+            server.kill()
+        server.wait()
+
+
+def deleteSharedDocuments(env: dict, userId: str):
+    import chromadb
+    from chromadb.config import Settings
+
+    client = chromadb.HttpClient(
+        host=env["CHROMA_HOST"],
+        port=int(env.get("CHROMA_PORT") or "8001"),
+        settings=Settings(anonymized_telemetry=False),
+    )
+    collection = client.get_collection(name="uploadedDocuments", embedding_function=None)
+    collection.delete(where={"userId": userId})
+
+
+def benchmarkWorkers(baseEnv: dict, workers: int, port: int, totalRequests: int, concurrency: int):
+    baseUrl = f"http://{HOST}:{port}"
+    userId = f"bench-{uuid.uuid4()}"
+    with tempfile.TemporaryDirectory(prefix="rag-bench-") as workDir:
+        env = dict(baseEnv)
+        env["UPLOAD_DIR"] = str(Path(workDir) / "uploaded_data")
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "main:app",
+                "--app-dir", str(REPO_DIR),
+                "--host", HOST, "--port", str(port),
+                "--workers", str(workers), "--log-level", "warning",
+            ],
+            cwd=workDir,
+            env=env,
+            start_new_session=True,
+        )
+        try:
+            waitForServer(server, baseUrl, workers)
+            try:
+                uploadRps, uploadFailures = runLoad(server, baseUrl, userId, uploadRequest, totalRequests, concurrency)
+                filesRps, filesFailures = runLoad(server, baseUrl, userId, filesRequest, totalRequests, concurrency)
+            finally:
+                # Only reached once the API was up, so a Chroma server that
+                # was never reachable cannot mask the startup error.
+                if env.get("CHROMA_HOST"):
+                    deleteSharedDocuments(env, userId)
+        finally:
+            stopServer(server)
+    return uploadRps, uploadFailures, filesRps, filesFailures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--mode", choices=["shared", "local"])
+    args = parser.parse_args()
+
+    # Same .env lookup as graph.py, so the labels match what the API will use.
+    load_dotenv(REPO_DIR / ".env")
+    baseEnv = os.environ.copy()
+    if args.mode == "local":
+        # load_dotenv never overrides a variable that is already set, so an
+        # empty value also masks .env in every worker.
+        baseEnv["CHROMA_HOST"] = ""
+        baseEnv["EMBEDDING_SERVICE_URL"] = ""
+    elif args.mode == "shared" and not (baseEnv.get("CHROMA_HOST") and baseEnv.get("EMBEDDING_SERVICE_URL")):
+        parser.error("--mode shared needs CHROMA_HOST and EMBEDDING_SERVICE_URL")
+
+    chromaMode = "http" if baseEnv.get("CHROMA_HOST") else "disk"
+    embedMode = "remote" if baseEnv.get("EMBEDDING_SERVICE_URL") else "local"
+    print(
+        f"chroma={chromaMode} embed={embedMode} "
+        f"requests={args.requests} concurrency={args.concurrency} cpus={os.cpu_count()}"
+    )
+    print(f"{'workers':>7} {'upload req/s':>13} {'fail':>5} {'files req/s':>12} {'fail':>5}")
+    for workers in args.workers:
+        uploadRps, uploadFailures, filesRps, filesFailures = benchmarkWorkers(
+            baseEnv, workers, args.port, args.requests, args.concurrency
+        )
+        print(f"{workers:>7} {uploadRps:>13} {uploadFailures:>5} {filesRps:>12} {filesFailures:>5}")
+
+
+if __name__ == "__main__":
+    main()
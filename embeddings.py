@@ -0,0 +1,43 @@
+from typing import List
+
+from chromadb.utils import embedding_functions
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+# Must match graph.MODEL_NAME; graph is not imported here because it would
+# pull the whole agent (LLM client, Chroma client) into the service.
+MODEL_NAME = "paraphrase-multilingual-MiniLM-L12-v2"
+
+# Run with: uvicorn embeddings:app --host 127.0.0.1 --port 8002
+# Keep this service single-worker so the model is held in RAM exactly once.
+app = FastAPI(title="Embedding Service")
+model = None
+
+
+class EmbedRequest(BaseModel):
+    texts: List[str]
+
+
+class EmbedResponse(BaseModel):
+    embeddings: List[List[float]]
+
+
+@app.on_event("startup")
+def loadModel():
+    global model
+    model = embedding_functions.SentenceTransformerEmbeddingFunction(
+        model_name=MODEL_NAME
+    )
+
+
+@app.get("/health")
+def health():
+    return {"model": MODEL_NAME, "loaded": model is not None}
+
+
+@app.post("/embed", response_model=EmbedResponse)
+def embed(request: EmbedRequest):
+    if not request.texts:
+        return EmbedResponse(embeddings=[])
+    vectors = model(request.texts)
+    return EmbedResponse(embeddings=[[float(x) for x in vector] for vector in vectors])
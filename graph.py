@@ -1,23 +1,67 @@
 from typing import TypedDict, Annotated, List, Union
 import operator
+import os
 from pathlib import Path
 
 import pandas as pd
 import uuid
 import chromadb
+import requests
+from chromadb import Documents, EmbeddingFunction, Embeddings
 from chromadb.utils import embedding_functions
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from langgraph.graph import StateGraph
 from chromadb.config import Settings
+from dotenv import load_dotenv
 
-chromaClient = chromadb.PersistentClient(
-    path="./chroma_db",
-    settings=Settings(anonymized_telemetry=False),
-)
-sentenceTransformer = embedding_functions.SentenceTransformerEmbeddingFunction(
-    model_name="paraphrase-multilingual-MiniLM-L12-v2"
-)
+load_dotenv()
+
+MODEL_NAME = "paraphrase-multilingual-MiniLM-L12-v2"
+
+# Multi-worker / multi-host deployments point every process at a shared Chroma
+# server and a shared embedding service; otherwise everything stays in-process.
+CHROMA_HOST = os.getenv("CHROMA_HOST")
+CHROMA_PORT = int(os.getenv("CHROMA_PORT", "8001"))
+EMBEDDING_SERVICE_URL = os.getenv("EMBEDDING_SERVICE_URL")
+
+
+class RemoteEmbeddingFunction(EmbeddingFunction):
+    """Chroma embedding function that delegates to the shared embedding service."""
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        response = self.session.post(
+            f"{self.url}/embed",
+            json={"texts": list(input)},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.json()["embeddings"]
+
+
+if CHROMA_HOST:
+    chromaClient = chromadb.HttpClient(
+        host=CHROMA_HOST,
+        port=CHROMA_PORT,
+        settings=Settings(anonymized_telemetry=False),
+    )
+else:
+    chromaClient = chromadb.PersistentClient(
+        path="./chroma_db",
+        settings=Settings(anonymized_telemetry=False),
+    )
+
+if EMBEDDING_SERVICE_URL:
+    sentenceTransformer = RemoteEmbeddingFunction(EMBEDDING_SERVICE_URL)
+else:
+    sentenceTransformer = embedding_functions.SentenceTransformerEmbeddingFunction(
+        model_name=MODEL_NAME
+    )
 collection = chromaClient.get_or_create_collection(
     name="conversationHistory", embedding_function=sentenceTransformer
 )
@@ -1,3 +1,4 @@
+import os
 import time
 import uuid
 import shutil
@@ -16,7 +17,8 @@ load_dotenv()
 
 app = FastAPI(title="Retail Insights Assistant API")
 
-UPLOAD_DIR = Path("uploaded_data")
+# Must be a shared mount (NFS, EFS, ...) when the API runs on several hosts.
+UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "uploaded_data"))
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 documentCollection = chromaClient.get_or_create_collection(
@@ -135,11 +137,17 @@ async def uploadDocument(
     )
 
 
+@app.get("/health")
+def health():
+    # The pid lets benchmark.py wait until every uvicorn worker is serving.
+    return {"pid": os.getpid()}
+
+
 @app.get("/files", response_model=List[UserFile])
 def listUserFiles(userId: str = Query(...)):
     results = documentCollection.get(
         where={"userId": userId},
-        include=["metadatas", "ids"],
+        include=["metadatas"],
     )
 
     files: List[UserFile] = []